@@ -6,4 +6,4 @@
 from .core import Schema, ValidationError
 
 # Import all validator classes from validators module
-from .validators import StringValidator, NumberValidator, BooleanValidator, DateValidator, ObjectValidator, ArrayValidator 
\ No newline at end of file
+from .validators import StringValidator, NumberValidator, BooleanValidator, DateValidator, ObjectValidator, ArrayValidator, MemoizedValidator 
\ No newline at end of file
@@ -1,6 +1,6 @@
 # Core module containing the main Schema builder class and ValidationError exception
 # This module provides the main API for creating and using validators
-from .validators import StringValidator, NumberValidator, BooleanValidator, DateValidator, ObjectValidator, ArrayValidator
+from .validators import Validator, StringValidator, NumberValidator, BooleanValidator, DateValidator, ObjectValidator, ArrayValidator, MemoizedValidator
 from .errors import ValidationError  # Import from new errors module
 
 class Schema:
@@ -73,4 +73,27 @@ class Schema:
         Returns:
             ArrayValidator instance for validating array structures
         """
-        return ArrayValidator(item_validator) 
\ No newline at end of file
+        return ArrayValidator(item_validator)
+    
+    @staticmethod
+    def memoized(validator: 'Validator', maxsize: int = 1024) -> MemoizedValidator:
+        """
+        Wrap a validator so repeated validation of the same input object is cached.
+        
+        Only use this for inputs that are not mutated after validation, or call
+        Schema.invalidate() after mutating them. Cached results are shared between
+        calls and must be treated as read-only.
+        
+        Args:
+            validator: Validator whose results should be cached
+            maxsize: Maximum number of cached results before the cache is reset
+            
+        Returns:
+            MemoizedValidator wrapping the given validator
+        """
+        return MemoizedValidator(validator, maxsize)
+    
+    @staticmethod
+    def invalidate() -> None:
+        """Drop the cached results of every memoized validator."""
+        MemoizedValidator.invalidate_all()
\ No newline at end of file
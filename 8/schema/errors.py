@@ -1,11 +1,12 @@
 # Error definitions for the validation library
+from typing import Optional
 
 class ValidationError(Exception):
     """
     Custom exception for validation errors with field path support.
     Provides detailed error information including the field path and custom messages.
     """
-    def __init__(self, message: str, field: str = None, path: list[str] = None):
+    def __init__(self, message: str, field: Optional[str] = None, path: Optional[list[str]] = None):
         """
         Initialize a validation error with message and optional field information.
         
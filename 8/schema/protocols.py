@@ -0,0 +1,14 @@
+# Protocol definitions for the validation library
+# Kept in their own module so the validators module can be compiled with mypyc,
+# which does not support runtime-checkable protocols
+from typing import Any, Protocol, runtime_checkable
+from typing_extensions import Self
+
+@runtime_checkable
+class ValidatorProtocol(Protocol):
+    """
+    Protocol defining the interface that all validators must implement.
+    This allows for runtime type checking of validator objects.
+    """
+    def validate(self, value: Any) -> Any: ...  # Validate a value and return the validated result
+    def with_message(self, message: str) -> Self: ...  # Set a custom error message
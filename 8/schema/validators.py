@@ -1,36 +1,156 @@
 # Schema Builder - Type-Safe Validation Library
 # This module contains all the validator classes for different data types
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Union, TypeVar, Generic, Protocol, runtime_checkable
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple, Type, Union, TypeVar, Generic
 from typing_extensions import Self
 import re
+import sys
+import weakref
+from types import MappingProxyType
 from datetime import datetime
+from functools import lru_cache, partial
 from abc import ABC, abstractmethod
 from .errors import ValidationError  # Import ValidationError for proper exception handling
+from .protocols import ValidatorProtocol  # Re-exported for backwards compatibility
+
+try:
+    import re2  # type: ignore[import-not-found]  # Optional linear-time regex engine (google-re2)
+except ImportError:
+    re2 = None
+
+try:
+    from mypy_extensions import mypyc_attr  # Only needed when the package is compiled with mypyc
+except ImportError:
+    def mypyc_attr(*attrs: str, **kwattrs: object) -> Callable[[Any], Any]:  # type: ignore[misc]
+        """No-op stand-in for mypy_extensions.mypyc_attr."""
+        return lambda cls: cls
+
+try:
+    from dateutil.parser import isoparse as _isoparse  # type: ignore[import-untyped]  # Optional fallback for less common ISO 8601 forms
+except ImportError:
+    _isoparse = None
+
+# Errors raised by the available regex engines for invalid patterns
+_PATTERN_ERRORS = (re.error,) if re2 is None else (re.error, re2.error)
+_PATTERN_ENGINES = ('re', 're2')
 
 # Type variables for generic validators
 T = TypeVar('T')  # Generic type for validated data
 V = TypeVar('V', bound='Validator')  # Type variable bound to Validator class
 
-@runtime_checkable
-class ValidatorProtocol(Protocol):
+_MISSING = object()  # Sentinel for absent dict keys, distinct from an explicit None
+
+class _Invalid:
+    """Failed leaf check returned by _check() in place of raising ValidationError."""
+    
+    __slots__ = ('message',)
+    
+    def __init__(self, message: str) -> None:
+        self.message = message
+
+@lru_cache(maxsize=512)
+def _compile_pattern(regex: str, engine: str = 're') -> re.Pattern:
+    """
+    Compile a regex once and share it between validators using the same pattern.
+    
+    The 're2' engine falls back to the standard 're' module when google-re2 is not installed.
+    """
+    if engine == 're2' and re2 is not None:
+        return re2.compile(regex)
+    return re.compile(regex)
+
+@lru_cache(maxsize=512)
+def _compile_digit_mask(mask: str) -> Callable[[str], Optional[re.Match]]:
+    """
+    Build a matcher for a fixed-shape mask where '#' is an ASCII digit and every
+    other character matches itself, e.g. "###-##-####".
+    
+    The mask becomes a flat regex of one single-character item per position, run
+    with fullmatch: no anchors, quantifiers or backtracking for the engine to walk.
+    """
+    return re.compile(''.join('[0-9]' if char == '#' else re.escape(char) for char in mask)).fullmatch
+
+@lru_cache(maxsize=512)
+def _field_layout(names: Tuple[str, ...]) -> Tuple[Dict[str, Any], FrozenSet[str]]:
     """
-    Protocol defining the interface that all validators must implement.
-    This allows for runtime type checking of validator objects.
+    Result template and allowed-field set for an object schema's field names.
+    
+    Cached so that object schemas with the same fields, e.g. built in a loop or in
+    every test, share one template and frozenset. Neither is ever mutated: the
+    template is only copied.
     """
-    def validate(self, value: Any) -> Any: ...  # Validate a value and return the validated result
-    def with_message(self, message: str) -> Self: ...  # Set a custom error message
+    return dict.fromkeys(names), frozenset(names)
 
+def _unique_key(item: Any) -> Any:
+    """
+    Build a hashable key identifying an array item for uniqueness checks.
+    
+    Keys are tagged with the item type so that e.g. 1, True and "1" stay distinct,
+    and built recursively so the same holds inside containers: {1: 'a'} and
+    {'1': 'a'}, or [1, 2] and (1, 2), are different items. Dict keys ignore order.
+    """
+    item_type = type(item)
+    if isinstance(item, dict):
+        return (item_type, frozenset([(_unique_key(k), _unique_key(v)) for k, v in item.items()]))
+    if isinstance(item, (list, tuple)):
+        return (item_type, tuple([_unique_key(v) for v in item]))
+    try:
+        hash(item)
+    except TypeError:
+        return (item_type, repr(item))
+    return (item_type, item)
+
+def _const(ns: Dict[str, Any], value: Any) -> str:
+    """Store a constant in a generated function's namespace and return its name."""
+    name = f"_c{len(ns)}"
+    ns[name] = value
+    return name
+
+def _raise_source(ns: Dict[str, Any], custom_message: Optional[str], default_source: str) -> str:
+    """Source line raising ValidationError with the custom message or the default message expression."""
+    if custom_message:
+        return f"raise ValidationError({_const(ns, custom_message)})"
+    return f"raise ValidationError({default_source})"
+
+def _parse_format(value: str, fmt: str) -> datetime:
+    """Parse a date string with a strptime format."""
+    return datetime.strptime(value, fmt)
+
+def _parse_iso(value: str) -> datetime:
+    """
+    Parse an ISO 8601 string, accepting a trailing 'Z' as UTC.
+    
+    The C-implemented fromisoformat handles the common case; strings it rejects are
+    retried with 'Z' spelled as an offset (older Pythons) and then, if installed,
+    with dateutil's full ISO 8601 parser (week dates, reduced precision, ...).
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        if _isoparse is None:
+            raise
+    return _isoparse(value)
+
+@mypyc_attr(allow_interpreted_subclasses=True)  # Users subclass validators
 class Validator(ABC):
     """
     Abstract base class for all validators.
     Provides common functionality like optional fields and custom error messages.
     """
     
+    # No per-instance __dict__; __weakref__ lets child validators track their owners
+    __slots__ = ('_custom_message', '_optional', '_owners', '__weakref__')
+    
     def __init__(self) -> None:
         """Initialize the base validator with default settings."""
         self._custom_message: Optional[str] = None  # Custom error message to use instead of default
         self._optional: bool = False  # Whether this field can be None/optional
+        # Validators built on this one that must hear of its configuration changes
+        self._owners: Optional[weakref.WeakSet[Validator]] = None
     
     def with_message(self, message: str) -> Self:
         """
@@ -43,6 +163,7 @@ class Validator(ABC):
             Self for method chaining
         """
         self._custom_message = message
+        self._changed()
         return self
     
     def optional(self) -> Self:
@@ -53,25 +174,63 @@ class Validator(ABC):
             Self for method chaining
         """
         self._optional = True
+        self._changed()
         return self
     
-    def _is_optional_and_none(self, value: Any) -> bool:
+    def _add_owner(self, owner: Validator) -> None:
+        """
+        Register a validator whose behaviour depends on this one's configuration.
+        
+        Args:
+            owner: The validator to notify from _changed(); held weakly
+        """
+        if self._owners is None:
+            self._owners = weakref.WeakSet()
+        self._owners.add(owner)
+    
+    def _changed(self) -> None:
+        """
+        Record a configuration change.
+        
+        Every setter that changes what validation does calls this. Owners that
+        derived state from this validator (e.g. an ObjectValidator's compiled
+        function) override it to drop that state, then pass the change on to their
+        own owners. Validators nobody owns yet return at once.
+        """
+        owners = self._owners
+        if owners:
+            for owner in list(owners):
+                owner._changed()
+    
+    def validate_many(self, values: Iterable[Any]) -> List[Any]:
         """
-        Check if the value is None and the field is marked as optional.
+        Validate a batch of values with this validator.
         
         Args:
-            value: The value to check
+            values: The values to validate
             
         Returns:
-            True if value is None and field is optional, False otherwise
+            List of validated values in input order
+            
+        Raises:
+            ValidationError: If any value fails, prefixed with its index
         """
-        return value is None and self._optional
+        items = values if isinstance(values, list) else list(values)
+        validate = self.validate  # Bind once for the whole batch
+        result: List[Any] = [None] * len(items)  # Pre-sized, filled by index
+        for i, item in enumerate(items):
+            try:
+                result[i] = validate(item)
+            except Exception as e:
+                # Add index context to error
+                raise ValidationError(f"[{i}]: {e}")
+        return result
     
-    @abstractmethod
     def validate(self, value: Any) -> Any:
         """
-        Abstract method that must be implemented by all validator subclasses.
-        Validates the given value according to the validator's rules.
+        Validate the given value according to the validator's rules.
+        Optional None values are accepted here once for every validator type;
+        everything else is delegated to the subclass's _validate().
         
         Args:
             value: The value to validate
@@ -82,13 +241,159 @@ class Validator(ABC):
         Raises:
             ValidationError: If validation fails
         """
+        if value is None and self._optional:
+            return None
+        return self._validate(value)
+    
+    def _codegen(self, var: str, ns: Dict[str, Any]) -> Optional[List[str]]:
+        """
+        Generate inline source lines performing this validator's checks.
+        
+        Used by ObjectValidator to compile a specialized validation function. The
+        lines validate the local variable `var` in place, leaving the validated
+        value in it, and may register constants in `ns`. Validators that cannot be
+        inlined return None and are called through validate() instead.
+        
+        Args:
+            var: Name of the local variable holding the value
+            ns: Namespace the generated function will be executed in
+            
+        Returns:
+            List of unindented source lines, or None if not supported
+        """
+        return None
+    
+    def _validate(self, value: Any) -> Any:
+        """
+        Validate a value that is not an accepted optional None.
+        
+        Subclasses implement either this method, to get optional handling from
+        validate(), or validate() itself as in earlier versions of the library.
+        
+        Args:
+            value: The value to validate
+            
+        Returns:
+            The validated value (may be transformed)
+            
+        Raises:
+            ValidationError: If validation fails
+            NotImplementedError: If the subclass implements neither method
+        """
+        raise NotImplementedError(f"{type(self).__name__} must implement validate() or _validate()")
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class _CheckedValidator(Validator):
+    """
+    Base class for leaf validators whose checks live in an exception-free _check().
+    
+    _check() returns the validated value or an _Invalid carrying the error message,
+    so batch loops can test results without paying for a raise per element; only
+    the single-value _validate() turns a failure into a ValidationError.
+    """
+    
+    __slots__ = ()
+    
+    def validate_many(self, values: Iterable[Any]) -> List[Any]:
+        """
+        Validate a batch of values, raising only once for the first failing item.
+        
+        Subclasses that override _validate() or validate() keep the per-item
+        validate() path; _check() overrides are honoured by the batch loop itself.
+        
+        Args:
+            values: The values to validate
+            
+        Returns:
+            List of validated values in input order
+            
+        Raises:
+            ValidationError: If any value fails, prefixed with its index
+        """
+        items = values if isinstance(values, list) else list(values)
+        kind = type(self)
+        if kind._validate is not _CheckedValidator._validate or kind.validate is not Validator.validate:
+            return super().validate_many(items)
+        
+        check = self._check  # Bind once for the whole batch
+        optional = self._optional
+        result: List[Any] = [None] * len(items)  # Pre-sized, filled by index
+        i = -1
+        try:
+            for i, item in enumerate(items):
+                if item is None and optional:
+                    continue  # Slot already holds None
+                checked = check(item)
+                if type(checked) is _Invalid:
+                    break
+                result[i] = checked
+            else:
+                return result
+        except Exception as e:
+            # Add index context to unexpected errors, as the per-item path does
+            raise ValidationError(f"[{i}]: {e}")
+        raise ValidationError(f"[{i}]: {checked.message}")
+    
+    def _uses_builtin_checks(self, cls: Type[_CheckedValidator]) -> bool:
+        """
+        Check whether this validator still runs cls's own checks.
+        
+        Fast paths that reimplement the checks of cls must not be taken by
+        subclasses that override _check(), _validate() or validate().
+        
+        Args:
+            cls: The built-in validator class whose checks a fast path reimplements
+            
+        Returns:
+            True if none of the validation methods are overridden below cls
+        """
+        kind = type(self)
+        return (
+            kind._check is cls._check
+            and kind._validate is _CheckedValidator._validate
+            and kind.validate is Validator.validate
+        )
+    
+    def _validate(self, value: Any) -> Any:
+        """
+        Validate a value that is not an accepted optional None using _check().
+        
+        Args:
+            value: The value to validate
+            
+        Returns:
+            The validated value (may be transformed)
+            
+        Raises:
+            ValidationError: If validation fails
+        """
+        result = self._check(value)
+        if type(result) is _Invalid:
+            raise ValidationError(result.message)
+        return result
+    
+    @abstractmethod
+    def _check(self, value: Any) -> Any:
+        """
+        Check a value that is not an accepted optional None without raising.
+        
+        Args:
+            value: The value to validate
+            
+        Returns:
+            The validated value (may be transformed), or an _Invalid describing the failure
+        """
         pass
 
-class StringValidator(Validator):
+@mypyc_attr(allow_interpreted_subclasses=True)
+class StringValidator(_CheckedValidator):
     """
-    Validator for string values with support for length constraints and regex patterns.
+    Validator for string values with support for length constraints, regex patterns
+    and fixed-shape digit masks.
     """
     
+    __slots__ = ('_min_length', '_max_length', '_pattern', '_compiled_pattern', '_digit_mask', '_mask_match')
+    
     def __init__(self) -> None:
         """Initialize string validator with no constraints."""
         super().__init__()
@@ -96,6 +401,8 @@ class StringValidator(Validator):
         self._max_length: Optional[int] = None  # Maximum string length requirement
         self._pattern: Optional[str] = None  # Regex pattern string
         self._compiled_pattern: Optional[re.Pattern] = None  # Compiled regex pattern for efficiency
+        self._digit_mask: Optional[str] = None  # Fixed-shape mask, '#' for a digit
+        self._mask_match: Optional[Callable[[str], Optional[re.Match]]] = None  # Compiled mask matcher
     
     def min_length(self, length: int) -> Self:
         """
@@ -113,6 +420,7 @@ class StringValidator(Validator):
         if length < 0:
             raise ValueError("Minimum length must be non-negative")
         self._min_length = length
+        self._changed()
         return self
     
     def max_length(self, length: int) -> Self:
@@ -131,76 +439,189 @@ class StringValidator(Validator):
         if length < 0:
             raise ValueError("Maximum length must be non-negative")
         self._max_length = length
+        self._changed()
         return self
     
-    def pattern(self, regex: str) -> Self:
+    def pattern(self, regex: str, engine: str = 're') -> Self:
         """
         Set a regex pattern that the string must match.
         
         Args:
             regex: Regular expression pattern string
+            engine: 're' for Python's backtracking engine, or 're2' for google-re2's
+                linear-time matcher (no backreferences or lookaround; falls back to
+                're' when google-re2 is not installed)
             
         Returns:
             Self for method chaining
             
         Raises:
-            ValueError: If the regex pattern is invalid
+            ValueError: If the regex pattern or engine is invalid
         """
+        if engine not in _PATTERN_ENGINES:
+            raise ValueError(f"Unknown regex engine: {engine}")
         try:
             self._pattern = regex
-            self._compiled_pattern = re.compile(regex)  # Compile for efficiency
-        except re.error as e:
+            self._compiled_pattern = _compile_pattern(regex, engine)  # Compiled once, shared across validators
+        except _PATTERN_ERRORS as e:
             raise ValueError(f"Invalid regex pattern: {e}")
+        self._changed()
         return self
     
-    def validate(self, value: Any) -> str:
+    def digit_mask(self, mask: str) -> Self:
         """
-        Validate that the value is a string meeting all constraints.
+        Require the string to have a fixed shape, e.g. "###-##-####" for an SSN.
+        
+        Each '#' matches one ASCII digit (0-9) and every other character must appear
+        as-is. Useful for fixed-width formats such as SSNs, phone numbers or card
+        numbers, and faster than an equivalent hand-written anchored pattern.
         
         Args:
-            value: The value to validate
+            mask: The mask string
             
         Returns:
-            The validated string value
-            
-        Raises:
-            ValidationError: If validation fails (wrong type, length, or pattern)
+            Self for method chaining
         """
-        # Handle optional None values
-        if self._is_optional_and_none(value):
-            return value
+        self._digit_mask = mask
+        self._mask_match = _compile_digit_mask(mask)  # Compiled once, shared across validators
+        self._changed()
+        return self
+    
+    def _check(self, value: Any) -> Union[str, _Invalid]:
+        """
+        Check that the value is a string meeting all constraints.
         
+        Args:
+            value: The value to validate
+            
+        Returns:
+            The validated string value, or an _Invalid describing the failure
+            (wrong type, length, pattern, or mask)
+        """
         # Check if value is a string
         if not isinstance(value, str):
-            raise ValidationError(
+            return _Invalid(
                 self._custom_message or f"Expected string, got {type(value).__name__}"
             )
         
         # Check minimum length constraint
         if self._min_length is not None and len(value) < self._min_length:
-            raise ValidationError(
+            return _Invalid(
                 self._custom_message or f"String must be at least {self._min_length} characters long"
             )
         
         # Check maximum length constraint
         if self._max_length is not None and len(value) > self._max_length:
-            raise ValidationError(
+            return _Invalid(
                 self._custom_message or f"String must be at most {self._max_length} characters long"
             )
         
         # Check regex pattern constraint
         if self._compiled_pattern is not None and not self._compiled_pattern.match(value):
-            raise ValidationError(
+            return _Invalid(
                 self._custom_message or f"String does not match pattern {self._pattern}"
             )
         
+        # Check digit mask constraint
+        if self._mask_match is not None and not self._mask_match(value):
+            return _Invalid(
+                self._custom_message or f"String does not match mask {self._digit_mask}"
+            )
+        
         return value
+    
+    def _codegen(self, var: str, ns: Dict[str, Any]) -> Optional[List[str]]:
+        """
+        Generate inline source lines for the string checks (see Validator._codegen).
+        
+        Args:
+            var: Name of the local variable holding the value
+            ns: Namespace the generated function will be executed in
+            
+        Returns:
+            List of unindented source lines, or None if a subclass changed the checks
+        """
+        if not self._uses_builtin_checks(StringValidator):
+            return None
+        message = self._custom_message
+        lines = [
+            f"if not isinstance({var}, str):",
+            "    " + _raise_source(ns, message, f"f'Expected string, got {{type({var}).__name__}}'"),
+        ]
+        if self._min_length is not None:
+            lines += [
+                f"if len({var}) < {self._min_length!r}:",
+                "    " + _raise_source(ns, message, _const(ns, f"String must be at least {self._min_length} characters long")),
+            ]
+        if self._max_length is not None:
+            lines += [
+                f"if len({var}) > {self._max_length!r}:",
+                "    " + _raise_source(ns, message, _const(ns, f"String must be at most {self._max_length} characters long")),
+            ]
+        if self._compiled_pattern is not None:
+            lines += [
+                f"if not {_const(ns, self._compiled_pattern.match)}({var}):",
+                "    " + _raise_source(ns, message, _const(ns, f"String does not match pattern {self._pattern}")),
+            ]
+        if self._mask_match is not None:
+            lines += [
+                f"if not {_const(ns, self._mask_match)}({var}):",
+                "    " + _raise_source(ns, message, _const(ns, f"String does not match mask {self._digit_mask}")),
+            ]
+        if self._optional:
+            lines = [f"if {var} is not None:"] + ["    " + line for line in lines]
+        return lines
+    
+    def validate_many(self, values: Iterable[Any]) -> List[str]:
+        """
+        Validate a batch of strings in a single tight pass.
+        
+        Constraints and the pattern and mask matchers are bound to locals once for the whole
+        batch. Valid strings are returned unchanged, so if every item passes the
+        input is copied as-is; otherwise the per-item path reports the exact error.
+        Subclasses that override the checks always take the per-item path.
+        
+        Args:
+            values: The values to validate
+            
+        Returns:
+            List of validated strings in input order
+            
+        Raises:
+            ValidationError: If any value fails, prefixed with its index
+        """
+        items = values if isinstance(values, list) else list(values)
+        if not self._uses_builtin_checks(StringValidator):
+            return super().validate_many(items)
+        min_length = self._min_length if self._min_length is not None else 0
+        max_length = self._max_length
+        match = self._compiled_pattern.match if self._compiled_pattern is not None else None
+        mask_match = self._mask_match
+        
+        for item in items:
+            if type(item) is not str:
+                break
+            length = len(item)
+            if length < min_length or (max_length is not None and length > max_length):
+                break
+            if match is not None and match(item) is None:
+                break
+            if mask_match is not None and mask_match(item) is None:
+                break
+        else:
+            return list(items)
+        
+        # Slow path: locate the failing item and raise its precise error
+        return super().validate_many(items)
 
-class NumberValidator(Validator):
+@mypyc_attr(allow_interpreted_subclasses=True)
+class NumberValidator(_CheckedValidator):
     """
     Validator for numeric values (int and float) with range constraints.
     """
     
+    __slots__ = ('_min_value', '_max_value', '_integer_only')
+    
     def __init__(self) -> None:
         """Initialize number validator with no constraints."""
         super().__init__()
@@ -219,6 +640,7 @@ class NumberValidator(Validator):
             Self for method chaining
         """
         self._min_value = value
+        self._changed()
         return self
     
     def max_value(self, value: Union[int, float]) -> Self:
@@ -232,6 +654,7 @@ class NumberValidator(Validator):
             Self for method chaining
         """
         self._max_value = value
+        self._changed()
         return self
     
     def integer_only(self) -> Self:
@@ -242,56 +665,130 @@ class NumberValidator(Validator):
             Self for method chaining
         """
         self._integer_only = True
+        self._changed()
         return self
     
-    def validate(self, value: Any) -> Union[int, float]:
+    def _check(self, value: Any) -> Union[int, float, _Invalid]:
         """
-        Validate that the value is a number meeting all constraints.
+        Check that the value is a number meeting all constraints.
         
         Args:
             value: The value to validate
             
         Returns:
-            The validated numeric value
-            
-        Raises:
-            ValidationError: If validation fails (wrong type, range, or integer constraint)
+            The validated numeric value, or an _Invalid describing the failure
+            (wrong type, range, or integer constraint)
         """
-        # Handle optional None values
-        if self._is_optional_and_none(value):
-            return value
-        
         # Check if value is a number
         if not isinstance(value, (int, float)):
-            raise ValidationError(
+            return _Invalid(
                 self._custom_message or f"Expected number, got {type(value).__name__}"
             )
         
         # Check integer-only constraint
         if self._integer_only and not isinstance(value, int):
-            raise ValidationError(
+            return _Invalid(
                 self._custom_message or "Expected integer, got float"
             )
         
         # Check minimum value constraint
         if self._min_value is not None and value < self._min_value:
-            raise ValidationError(
+            return _Invalid(
                 self._custom_message or f"Value must be at least {self._min_value}"
             )
         
         # Check maximum value constraint
         if self._max_value is not None and value > self._max_value:
-            raise ValidationError(
+            return _Invalid(
                 self._custom_message or f"Value must be at most {self._max_value}"
             )
         
         return value
+    
+    def _codegen(self, var: str, ns: Dict[str, Any]) -> Optional[List[str]]:
+        """
+        Generate inline source lines for the number checks (see Validator._codegen).
+        
+        Args:
+            var: Name of the local variable holding the value
+            ns: Namespace the generated function will be executed in
+            
+        Returns:
+            List of unindented source lines, or None if a subclass changed the checks
+        """
+        if not self._uses_builtin_checks(NumberValidator):
+            return None
+        message = self._custom_message
+        lines = [
+            f"if not isinstance({var}, (int, float)):",
+            "    " + _raise_source(ns, message, f"f'Expected number, got {{type({var}).__name__}}'"),
+        ]
+        if self._integer_only:
+            lines += [
+                f"if not isinstance({var}, int):",
+                "    " + _raise_source(ns, message, _const(ns, "Expected integer, got float")),
+            ]
+        if self._min_value is not None:
+            lines += [
+                f"if {var} < {_const(ns, self._min_value)}:",
+                "    " + _raise_source(ns, message, _const(ns, f"Value must be at least {self._min_value}")),
+            ]
+        if self._max_value is not None:
+            lines += [
+                f"if {var} > {_const(ns, self._max_value)}:",
+                "    " + _raise_source(ns, message, _const(ns, f"Value must be at most {self._max_value}")),
+            ]
+        if self._optional:
+            lines = [f"if {var} is not None:"] + ["    " + line for line in lines]
+        return lines
+    
+    def validate_many(self, values: Iterable[Any]) -> List[Union[int, float]]:
+        """
+        Validate a batch of numbers in a single tight pass.
+        
+        Bounds and the integer-only flag are bound to locals once for the whole batch
+        and plain int/float items are checked with exact type tests. Anything else
+        (including bool and None) goes through the per-item path for its exact result
+        or error, as do subclasses that override the checks.
+        
+        Args:
+            values: The values to validate
+            
+        Returns:
+            List of validated numbers in input order
+            
+        Raises:
+            ValidationError: If any value fails, prefixed with its index
+        """
+        items = values if isinstance(values, list) else list(values)
+        if not self._uses_builtin_checks(NumberValidator):
+            return super().validate_many(items)
+        min_value = self._min_value
+        max_value = self._max_value
+        integer_only = self._integer_only
+        
+        for item in items:
+            item_type = type(item)
+            if item_type is not int and (item_type is not float or integer_only):
+                break
+            if min_value is not None and item < min_value:
+                break
+            if max_value is not None and item > max_value:
+                break
+        else:
+            return list(items)
+        
+        # Slow path: handle special items and raise the precise error
+        return super().validate_many(items)
 
-class BooleanValidator(Validator):
+@mypyc_attr(allow_interpreted_subclasses=True)
+class BooleanValidator(_CheckedValidator):
     """
     Validator for boolean values with optional strict mode.
     """
     
+    __slots__ = ('_strict',)
+    
     def __init__(self) -> None:
         """Initialize boolean validator in strict mode."""
         super().__init__()
@@ -308,45 +805,67 @@ class BooleanValidator(Validator):
             Self for method chaining
         """
         self._strict = strict
+        self._changed()
         return self
     
-    def validate(self, value: Any) -> bool:
+    def _check(self, value: Any) -> Union[bool, _Invalid]:
         """
-        Validate that the value is a boolean (or truthy/falsy in non-strict mode).
+        Check that the value is a boolean (or truthy/falsy in non-strict mode).
         
         Args:
             value: The value to validate
             
         Returns:
-            The validated boolean value
-            
-        Raises:
-            ValidationError: If validation fails in strict mode
+            The validated boolean value, or an _Invalid if strict mode rejects it
         """
-        # Handle optional None values
-        if self._is_optional_and_none(value):
-            return value
-        
         if self._strict:
             # Strict mode: only accept actual boolean values
             if not isinstance(value, bool):
-                raise ValidationError(
+                return _Invalid(
                     self._custom_message or f"Expected boolean, got {type(value).__name__}"
                 )
             return value
         else:
             # Non-strict mode: accept any truthy/falsy value
             return bool(value)
+    
+    def _codegen(self, var: str, ns: Dict[str, Any]) -> Optional[List[str]]:
+        """
+        Generate inline source lines for the boolean checks (see Validator._codegen).
+        
+        Args:
+            var: Name of the local variable holding the value
+            ns: Namespace the generated function will be executed in
+            
+        Returns:
+            List of unindented source lines, or None if a subclass changed the checks
+        """
+        if not self._uses_builtin_checks(BooleanValidator):
+            return None
+        if self._strict:
+            lines = [
+                f"if not isinstance({var}, bool):",
+                "    " + _raise_source(ns, self._custom_message, f"f'Expected boolean, got {{type({var}).__name__}}'"),
+            ]
+        else:
+            lines = [f"{var} = bool({var})"]
+        if self._optional:
+            lines = [f"if {var} is not None:"] + ["    " + line for line in lines]
+        return lines
 
-class DateValidator(Validator):
+@mypyc_attr(allow_interpreted_subclasses=True)
+class DateValidator(_CheckedValidator):
     """
     Validator for date values with support for multiple formats.
     """
     
+    __slots__ = ('_formats', '_string_parsers', '_accepts_timestamp')
+    
     def __init__(self) -> None:
         """Initialize date validator with ISO and timestamp format support."""
         super().__init__()
         self._formats: List[str] = ['iso', 'timestamp']  # Supported date formats
+        self._compile_formats()
     
     def formats(self, *formats: str) -> Self:
         """
@@ -359,63 +878,106 @@ class DateValidator(Validator):
             Self for method chaining
         """
         self._formats = list(formats)
+        self._compile_formats()
+        self._changed()
         return self
     
-    def validate(self, value: Any) -> datetime:
+    def _compile_formats(self) -> None:
+        """Precompute the string parsers and timestamp support for the accepted formats."""
+        parsers: List[Callable[[str], datetime]] = []
+        if 'iso' in self._formats:
+            parsers.append(_parse_iso)  # ISO is always tried first
+        for fmt in self._formats:
+            if fmt not in ('iso', 'timestamp'):
+                parsers.append(partial(_parse_format, fmt=fmt))
+        self._string_parsers: Tuple[Callable[[str], datetime], ...] = tuple(parsers)
+        self._accepts_timestamp: bool = 'timestamp' in self._formats
+    
+    def _parse_string(self, value: str) -> Optional[datetime]:
         """
-        Validate that the value is a valid date in one of the accepted formats.
+        Parse a date string with the first matching format.
         
         Args:
-            value: The value to validate (string, datetime, or timestamp)
+            value: The date string to parse
             
         Returns:
-            The validated datetime object
+            The parsed datetime, or None if no format matched
+        """
+        for parse in self._string_parsers:
+            try:
+                return parse(value)
+            except ValueError:
+                continue
+        return None
+    
+    def _parse_timestamp(self, value: Union[int, float]) -> Optional[datetime]:
+        """
+        Convert a Unix timestamp to a datetime if timestamps are accepted.
+        
+        Args:
+            value: The numeric timestamp
             
-        Raises:
-            ValidationError: If validation fails (unsupported format or invalid date)
+        Returns:
+            The converted datetime, or None if timestamps are not accepted or out of range
         """
-        # Handle optional None values
-        if self._is_optional_and_none(value):
-            return value
+        if not self._accepts_timestamp:
+            return None
+        try:
+            return datetime.fromtimestamp(value)
+        except (ValueError, OSError, OverflowError):
+            return None
+    
+    def _check(self, value: Any) -> Union[datetime, _Invalid]:
+        """
+        Check that the value is a valid date in one of the accepted formats.
         
-        # If already a datetime object, return it
-        if isinstance(value, datetime):
+        Args:
+            value: The value to validate (string, datetime, or timestamp)
+            
+        Returns:
+            The validated datetime object, or an _Invalid if no format matched
+        """
+        # Dispatch on the exact type first, falling back to isinstance for subclasses
+        value_type = type(value)
+        if value_type is datetime:
+            return value
+        if value_type is str:
+            parsed = self._parse_string(value)
+        elif value_type is int or value_type is float:
+            parsed = self._parse_timestamp(value)
+        elif isinstance(value, datetime):
             return value
+        elif isinstance(value, str):
+            parsed = self._parse_string(value)
+        elif isinstance(value, (int, float)):
+            parsed = self._parse_timestamp(value)
+        else:
+            parsed = None
         
-        # Handle string values
-        if isinstance(value, str):
-            # Try ISO format first
-            if 'iso' in self._formats:
-                try:
-                    return datetime.fromisoformat(value.replace('Z', '+00:00'))
-                except ValueError:
-                    pass
-            
-            # Try other custom formats
-            for fmt in self._formats:
-                if fmt != 'iso':
-                    try:
-                        return datetime.strptime(value, fmt)
-                    except ValueError:
-                        continue
-        
-        # Handle timestamp values (int/float)
-        elif isinstance(value, (int, float)) and 'timestamp' in self._formats:
-            try:
-                return datetime.fromtimestamp(value)
-            except (ValueError, OSError):
-                pass
+        if parsed is not None:
+            return parsed
         
         # If we get here, no format worked
-        raise ValidationError(
+        return _Invalid(
             self._custom_message or f"Expected date, got {type(value).__name__}"
         )
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class ObjectValidator(Validator, Generic[T]):
     """
     Validator for dictionary/object values with nested field validation.
+    
+    On first use the schema is compiled into a specialized Python function with
+    the checks of string, number and boolean fields inlined; other fields call
+    their validator. Reconfiguring the schema or one of its field validators
+    through their setters makes it recompile on its next use.
     """
     
+    __slots__ = (
+        'schema', '_strict', '_allow_extra', '_result_template', '_field_items', '_allowed_fields',
+        '_compiled',
+    )
+    
     def __init__(self, schema: Dict[str, Validator]) -> None:
         """
         Initialize object validator with a schema defining field validators.
@@ -424,9 +986,27 @@ class ObjectValidator(Validator, Generic[T]):
             schema: Dictionary mapping field names to their validators
         """
         super().__init__()
-        self.schema: Dict[str, Validator] = schema  # Field name -> validator mapping
+        # Field name -> validator mapping, with names interned so lookups in
+        # validated dicts (whose literal keys are interned too) hit on identity
+        schema = {sys.intern(name) if type(name) is str else name: validator for name, validator in schema.items()}
+        # Read-only view: the field layout below is derived from it once, so a
+        # schema with different fields needs a new ObjectValidator
+        self.schema: Mapping[str, Validator] = MappingProxyType(schema)
         self._strict: bool = True  # Whether to reject extra fields
         self._allow_extra: bool = False  # Whether to allow fields not in schema
+        # Schema-level data derived once here instead of on every validate() call;
+        # the pre-sized result dict and the allowed fields for strict-mode checks
+        # are shared with other schemas that have the same fields
+        self._result_template, self._allowed_fields = _field_layout(tuple(schema))
+        self._field_items: Tuple[Tuple[str, Validator], ...] = tuple(schema.items())  # Flat field list
+        self._compiled: Optional[Callable[[Any], Dict[str, Any]]] = None  # Generated on first validation
+        for validator in schema.values():
+            validator._add_owner(self)  # Field changes must reach the compiled function
+    
+    def _changed(self) -> None:
+        """Drop the compiled function after a change to this schema or one of its fields."""
+        self._compiled = None
+        super()._changed()
     
     def strict(self, strict: bool = True) -> Self:
         """
@@ -439,6 +1019,7 @@ class ObjectValidator(Validator, Generic[T]):
             Self for method chaining
         """
         self._strict = strict
+        self._changed()  # Recompile with the new mode
         return self
     
     def allow_extra(self, allow: bool = True) -> Self:
@@ -452,9 +1033,65 @@ class ObjectValidator(Validator, Generic[T]):
             Self for method chaining
         """
         self._allow_extra = allow
+        self._changed()  # Recompile with the new mode
         return self
     
-    def validate(self, value: Any) -> Dict[str, Any]:
+    def _compile(self) -> Callable[[Any], Dict[str, Any]]:
+        """
+        Generate and cache a straight-line validation function for this schema.
+        
+        Returns:
+            Function validating a (non-None) value and returning the result dict
+        """
+        ns: Dict[str, Any] = {
+            'ValidationError': ValidationError,
+            '_MISSING': _MISSING,
+            '_new_result': self._result_template.copy,
+            '_allowed_fields': self._allowed_fields,
+        }
+        body = [
+            "if not isinstance(value, dict):",
+            "    " + _raise_source(ns, self._custom_message, "f'Expected object, got {type(value).__name__}'"),
+        ]
+        
+        # Check for extra fields in strict mode
+        if self._strict and not self._allow_extra:
+            body += [
+                "if not _allowed_fields.issuperset(value):",
+                "    extra_fields = value.keys() - _allowed_fields",
+                "    raise ValidationError(f\"Unexpected fields: {', '.join(extra_fields)}\")",
+            ]
+        
+        # Validate each field in schema order, inlining leaf checks where possible
+        body += ["get = value.get", "result = _new_result()"]
+        for i, (field_name, validator) in enumerate(self._field_items):
+            var = f"f{i}"
+            key = _const(ns, field_name)
+            checks = validator._codegen(var, ns)
+            if checks is None:
+                checks = [f"{var} = {_const(ns, validator.validate)}({var})"]
+            body += [
+                f"{var} = get({key}, _MISSING)",
+                f"if {var} is not _MISSING:",
+                "    try:",
+                *["        " + line for line in checks],
+                "    except Exception as e:",
+                f"        raise ValidationError({_const(ns, f'{field_name}: ')} + str(e))",
+                f"    result[{key}] = {var}",
+            ]
+            if not validator._optional:
+                body += [
+                    "else:",
+                    f"    raise ValidationError({_const(ns, f'Missing required field: {field_name}')})",
+                ]
+        body.append("return result")
+        
+        source = "def _validate_object(value):\n" + "\n".join("    " + line for line in body)
+        exec(compile(source, "<schema.ObjectValidator>", "exec"), ns)
+        self._compiled = ns['_validate_object']
+        return self._compiled
+    
+    def _validate(self, value: Any) -> Dict[str, Any]:
         """
         Validate that the value is a dictionary with valid field values.
         
@@ -467,48 +1104,53 @@ class ObjectValidator(Validator, Generic[T]):
         Raises:
             ValidationError: If validation fails (wrong type, missing fields, or field validation fails)
         """
-        # Handle optional None values
-        if self._is_optional_and_none(value):
-            return value
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self._compile()
+        return compiled(value)
+    
+    def validate_many(self, records: Iterable[Any]) -> List[Dict[str, Any]]:
+        """
+        Validate a batch of records against this object schema.
         
-        # Check if value is a dictionary
-        if not isinstance(value, dict):
-            raise ValidationError(
-                self._custom_message or f"Expected object, got {type(value).__name__}"
-            )
+        The compiled validation function and optional flag are looked up once for
+        the whole batch instead of once per record.
         
-        # Check for extra fields in strict mode
-        if self._strict and not self._allow_extra:
-            extra_fields = set(value.keys()) - set(self.schema.keys())
-            if extra_fields:
-                raise ValidationError(
-                    f"Unexpected fields: {', '.join(extra_fields)}"
-                )
+        Args:
+            records: The records to validate
+            
+        Returns:
+            List of dictionaries with validated field values, in input order
+            
+        Raises:
+            ValidationError: If any record fails, prefixed with its index
+        """
+        items = records if isinstance(records, list) else list(records)
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self._compile()
+        optional = self._optional
         
-        # Validate each field in the schema
-        result: Dict[str, Any] = {}
-        for field_name, validator in self.schema.items():
-            if field_name in value:
-                # Field exists, validate it
-                try:
-                    result[field_name] = validator.validate(value[field_name])
-                except Exception as e:
-                    # Add field context to error
-                    raise ValidationError(f"{field_name}: {e}")
-            elif hasattr(validator, '_optional') and validator._optional:
-                # Field is optional and missing, set to None
-                result[field_name] = None
-            else:
-                # Required field is missing
-                raise ValidationError(f"Missing required field: {field_name}")
+        results: List[Any] = [None] * len(items)  # Pre-sized, filled by index
+        for i, record in enumerate(items):
+            if record is None and optional:
+                continue  # Slot already holds None
+            try:
+                results[i] = compiled(record)
+            except Exception as e:
+                # Add record index context to error
+                raise ValidationError(f"[{i}]: {e}")
         
-        return result
+        return results
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class ArrayValidator(Validator, Generic[T]):
     """
     Validator for list/array values with item validation and constraints.
     """
     
+    __slots__ = ('item_validator', '_min_length', '_max_length', '_unique')
+    
     def __init__(self, item_validator: Validator) -> None:
         """
         Initialize array validator with an item validator.
@@ -518,6 +1160,7 @@ class ArrayValidator(Validator, Generic[T]):
         """
         super().__init__()
         self.item_validator: Validator = item_validator  # Validator for array items
+        item_validator._add_owner(self)  # Pass item changes on to this array's owners
         self._min_length: Optional[int] = None  # Minimum array length
         self._max_length: Optional[int] = None  # Maximum array length
         self._unique: bool = False  # Whether items must be unique
@@ -538,6 +1181,7 @@ class ArrayValidator(Validator, Generic[T]):
         if length < 0:
             raise ValueError("Minimum length must be non-negative")
         self._min_length = length
+        self._changed()
         return self
     
     def max_length(self, length: int) -> Self:
@@ -556,6 +1200,7 @@ class ArrayValidator(Validator, Generic[T]):
         if length < 0:
             raise ValueError("Maximum length must be non-negative")
         self._max_length = length
+        self._changed()
         return self
     
     def unique(self, unique: bool = True) -> Self:
@@ -569,9 +1214,10 @@ class ArrayValidator(Validator, Generic[T]):
             Self for method chaining
         """
         self._unique = unique
+        self._changed()
         return self
     
-    def validate(self, value: Any) -> List[T]:
+    def _validate(self, value: Any) -> List[T]:
         """
         Validate that the value is a list with valid items meeting all constraints.
         
@@ -584,10 +1230,6 @@ class ArrayValidator(Validator, Generic[T]):
         Raises:
             ValidationError: If validation fails (wrong type, length, uniqueness, or item validation)
         """
-        # Handle optional None values
-        if self._is_optional_and_none(value):
-            return value
-        
         # Check if value is a list
         if not isinstance(value, list):
             raise ValidationError(
@@ -606,28 +1248,114 @@ class ArrayValidator(Validator, Generic[T]):
                 self._custom_message or f"Array must have at most {self._max_length} items"
             )
         
-        # Validate each item in the array
-        result: List[T] = []
-        for i, item in enumerate(value):
-            try:
-                validated_item = self.item_validator.validate(item)
-                result.append(validated_item)
-            except Exception as e:
-                # Add array index context to error
-                raise ValidationError(f"[{i}]: {e}")
+        # Validate all items in one batch (errors carry the array index)
+        result: List[T] = self.item_validator.validate_many(value)
         
         # Check uniqueness constraint
         if self._unique:
-            unique_items = set()
+            # Single pass over hashable keys, stopping at the first duplicate
+            seen: set = set()
+            add = seen.add
             for item in result:
-                if isinstance(item, (dict, list)):
-                    # For complex types, use string representation for comparison
-                    item_str = str(item)
-                else:
-                    item_str = str(item)
-                
-                if item_str in unique_items:
+                key = _unique_key(item)
+                if key in seen:
                     raise ValidationError("Array items must be unique")
-                unique_items.add(item_str)
+                add(key)
         
-        return result 
\ No newline at end of file
+        return result
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class MemoizedValidator(Validator):
+    """
+    Opt-in wrapper that caches the results of another validator per input object.
+    
+    Results are keyed on the identity of the validated value, so the wrapper is only
+    safe for inputs that are not mutated after validation. Call Schema.invalidate()
+    to drop all cached results, e.g. after such a mutation. Reconfiguring the wrapped
+    validator, or any validator nested in it, clears this wrapper's cache.
+    
+    A cache hit returns the very result object produced the first time, not a copy
+    (a deep copy measured about twice as slow as validating again). Results are shared
+    and read-only; copy one before modifying it.
+    """
+    
+    __slots__ = ('validator', '_maxsize', '_cache')
+    
+    _generation: ClassVar[int] = 0  # Bumped by invalidate_all() to expire every cache at once
+    
+    def __init__(self, validator: Validator, maxsize: int = 1024) -> None:
+        """
+        Initialize the memoizing wrapper.
+        
+        Args:
+            validator: The validator whose results should be cached
+            maxsize: Maximum number of cached results before the cache is reset
+        """
+        super().__init__()
+        self.validator: Validator = validator  # Wrapped validator doing the actual work
+        validator._add_owner(self)  # Its configuration changes expire the cache
+        self._optional = validator._optional  # Mirror optionality for ObjectValidator
+        self._maxsize: int = maxsize
+        # id(value) -> (generation, value, result); holding value keeps its id from being reused
+        self._cache: Dict[int, Tuple[int, Any, Any]] = {}
+    
+    @classmethod
+    def invalidate_all(cls) -> None:
+        """Expire the cached results of every memoized validator."""
+        cls._generation += 1
+    
+    def _changed(self) -> None:
+        """Drop cached results after the wrapped validator (or anything in it) is reconfigured."""
+        self._cache.clear()
+        super()._changed()
+    
+    def with_message(self, message: str) -> Self:
+        """
+        Set a custom error message on the wrapped validator.
+        
+        Args:
+            message: The custom error message to display on validation failure
+            
+        Returns:
+            Self for method chaining
+        """
+        self.validator.with_message(message)
+        self._cache.clear()
+        return self
+    
+    def optional(self) -> Self:
+        """
+        Mark the wrapped validator as optional (can be None).
+        
+        Returns:
+            Self for method chaining
+        """
+        self.validator.optional()
+        self._optional = True
+        self._cache.clear()
+        return self
+    
+    def _validate(self, value: Any) -> Any:
+        """
+        Return the cached result for this exact value, validating it on a cache miss.
+        
+        Args:
+            value: The value to validate
+            
+        Returns:
+            The validated value produced by the wrapped validator
+            
+        Raises:
+            ValidationError: If validation fails (failures are never cached)
+        """
+        cache = self._cache
+        generation = MemoizedValidator._generation
+        entry = cache.get(id(value))
+        if entry is not None and entry[0] == generation and entry[1] is value:
+            return entry[2]
+        
+        result = self.validator.validate(value)
+        if len(cache) >= self._maxsize:
+            cache.clear()  # Simple reset keeps lookups O(1) without LRU bookkeeping
+        cache[id(value)] = (generation, value, result)
+        return result
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Build script for the schema validation library.
+
+A plain install ships the pure-Python package. Set SCHEMA_MYPYC=1 to compile the
+validator modules to C extensions with mypyc (requires mypy at build time):
+
+    SCHEMA_MYPYC=1 pip install .
+"""
+
+import os
+from setuptools import setup, find_packages
+
+# Modules compiled by mypyc; schema.protocols stays pure Python (runtime-checkable Protocol)
+MYPYC_MODULES = [
+    "schema/errors.py",
+    "schema/validators.py",
+    "schema/core.py",
+]
+
+ext_modules = []
+if os.environ.get("SCHEMA_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify(MYPYC_MODULES)
+
+setup(
+    name="schema",
+    version="1.0.0",
+    description="A robust, type-safe validation library for complex data structures",
+    packages=find_packages(exclude=["tests"]),
+    python_requires=">=3.9",  # Built-in generics (list[str], dict[...]) are evaluated at import
+    install_requires=["typing-extensions>=4.0.0"],
+    ext_modules=ext_modules,
+)
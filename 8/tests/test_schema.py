@@ -14,8 +14,9 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from schema import (
     Schema, ValidationError, StringValidator, NumberValidator, 
-    BooleanValidator, DateValidator, ObjectValidator, ArrayValidator
+    BooleanValidator, DateValidator, ObjectValidator, ArrayValidator, MemoizedValidator
 )
+from schema.validators import Validator
 
 class TestStringValidator:
     """Test string validation with type safety"""
@@ -53,15 +54,61 @@ class TestStringValidator:
         with pytest.raises(ValidationError, match="does not match pattern"):
             validator.validate("123-456-789")
     
-    def test_string_optional(self):
-        """Test optional string validation - allows None values"""
-        validator = Schema.string().optional()
+    def test_string_pattern_is_shared(self):
+        """Test that identical patterns reuse one compiled regex across validators"""
+        first = Schema.string().pattern(r'^[a-z]+$')
+        second = Schema.string().pattern(r'^[a-z]+$')
         
-        assert validator.validate(None) is None  # None should be allowed
-        assert validator.validate("hello") == "hello"  # Valid string should still work
+        assert first._compiled_pattern is second._compiled_pattern  # Compiled once
         
-        with pytest.raises(ValidationError, match="Expected string"):
-            validator.validate(123)  # Non-string should still fail
+        with pytest.raises(ValueError, match="Invalid regex pattern"):
+            Schema.string().pattern(r'[unclosed')  # Invalid patterns are still reported
+    
+    def test_string_pattern_re2_engine(self):
+        """Test the opt-in re2 engine (falls back to re when google-re2 is missing)"""
+        validator = Schema.string().pattern(r'^\d{3}-\d{2}-\d{4}$', engine='re2')
+        
+        assert validator.validate("123-45-6789") == "123-45-6789"  # Matches as with re
+        
+        with pytest.raises(ValidationError, match="does not match pattern"):
+            validator.validate("123-456-789")
+        
+        with pytest.raises(ValueError, match="Unknown regex engine"):
+            Schema.string().pattern(r'^a$', engine='pcre')  # Unsupported engine
+    
+    def test_string_digit_mask(self):
+        """Test fixed-shape digit masks - '#' is an ASCII digit, other characters are literal"""
+        validator = Schema.string().digit_mask("###-##-####")  # SSN format
+        
+        assert validator.validate("123-45-6789") == "123-45-6789"  # Matches mask
+        assert validator.validate_many(["000-00-0000", "999-99-9999"]) == ["000-00-0000", "999-99-9999"]
+        
+        for bad in ["123-456-789", "123-45-678", "123-45-67890", "12a-45-6789", "123-45-678\u0663"]:
+            with pytest.raises(ValidationError, match="does not match mask ###-##-####"):
+                validator.validate(bad)  # Wrong shape, length, or non-ASCII digit
+    
+    def test_string_validate_many(self):
+        """Test batch string validation - same results and errors as per-item validation"""
+        validator = Schema.string().min_length(2).pattern(r'^[a-z]+$')
+        
+        assert validator.validate_many(["ab", "cd", "efg"]) == ["ab", "cd", "efg"]  # All valid
+        assert validator.validate_many(iter(["xy"])) == ["xy"]  # Any iterable is accepted
+        
+        with pytest.raises(ValidationError, match=r"\[1\]: String does not match pattern"):
+            validator.validate_many(["ab", "CD"])  # Error reports the failing index
+    
+    def test_string_array_respects_subclass_checks(self):
+        """Test that array validation runs a string subclass's own checks"""
+        class LowerStringValidator(StringValidator):
+            __slots__ = ()
+            
+            def _check(self, value):
+                result = super()._check(value)
+                return result.lower() if isinstance(result, str) else result
+        
+        validator = Schema.array(LowerStringValidator())
+        assert validator.validate(["ABC", "De"]) == ["abc", "de"]
+        assert validator.validate(["ABC"]) == [LowerStringValidator().validate("ABC")]
 
 class TestNumberValidator:
     """Test number validation with type safety"""
@@ -99,12 +146,50 @@ class TestNumberValidator:
         with pytest.raises(ValidationError, match="Expected integer"):
             validator.validate(3.14)  # Float should fail
     
-    def test_number_optional(self):
-        """Test optional number validation - allows None values"""
-        validator = Schema.number().optional()
+    def test_number_validate_many(self):
+        """Test batch number validation - same results and errors as per-item validation"""
+        validator = Schema.number().min_value(0).max_value(10).integer_only()
+        
+        assert validator.validate_many([0, 5, 10]) == [0, 5, 10]  # All valid
+        assert validator.validate_many([True]) == [True]  # Non-plain numbers use the per-item path
+        
+        with pytest.raises(ValidationError, match=r"\[2\]: Expected integer"):
+            validator.validate_many([1, 2, 3.5])
+        
+        with pytest.raises(ValidationError, match=r"\[0\]: Value must be at most 10"):
+            validator.validate_many([11])
+    
+    def test_number_array_respects_subclass_checks(self):
+        """Test that array validation runs a number subclass's own checks"""
+        class DoubledNumberValidator(NumberValidator):
+            __slots__ = ()
+            
+            def _validate(self, value):
+                return super()._validate(value) * 2
+        
+        validator = Schema.array(DoubledNumberValidator())
+        assert validator.validate([1, 2.5]) == [2, 5.0]
+
+class TestOptionalValidators:
+    """Test optional validation across validator types"""
+    
+    @pytest.mark.parametrize("factory,good,bad,error", [
+        pytest.param(Schema.string, "hello", 123, "Expected string", id="string"),
+        pytest.param(Schema.number, 42, "42", "Expected number", id="number"),
+        pytest.param(Schema.boolean, True, 1, "Expected boolean", id="boolean"),
+        pytest.param(Schema.date, datetime(2024, 1, 1), [], "Expected date", id="date"),
+        pytest.param(lambda: Schema.array(Schema.string()), ["a"], "a", "Expected array", id="array"),
+        pytest.param(lambda: Schema.object({}), {}, [], "Expected object", id="object"),
+    ])
+    def test_optional(self, factory, good, bad, error):
+        """Test optional validation - allows None values while still rejecting invalid ones"""
+        validator = factory().optional()
         
         assert validator.validate(None) is None  # None should be allowed
-        assert validator.validate(42) == 42  # Valid number should still work
+        assert validator.validate(good) == good  # Valid value should still work
+        
+        with pytest.raises(ValidationError, match=error):
+            validator.validate(bad)  # Invalid value should still fail
 
 class TestBooleanValidator:
     """Test boolean validation with type safety"""
@@ -129,6 +214,25 @@ class TestBooleanValidator:
         assert validator.validate(0) is False     # Falsy should become False
         assert validator.validate("hello") is True  # Non-empty string is truthy
         assert validator.validate("") is False    # Empty string is falsy
+    
+    def test_boolean_array_reports_first_failure(self):
+        """Test batch boolean checks - optional None passes, first failing index is reported"""
+        validator = Schema.array(Schema.boolean().optional())
+        
+        assert validator.validate([True, None, False]) == [True, None, False]  # None allowed when optional
+        
+        with pytest.raises(ValidationError, match=r"^\[1\]: Expected boolean, got int$"):
+            validator.validate([True, 1, "no"])  # Only the first bad item is reported
+    
+    def test_boolean_array_respects_validate_override(self):
+        """Test that batch checks do not bypass a subclass's validate()"""
+        class YesNoValidator(BooleanValidator):
+            __slots__ = ()
+            
+            def validate(self, value):
+                return super().validate({'yes': True, 'no': False}.get(value, value))
+        
+        assert Schema.array(YesNoValidator()).validate(["yes", False, "no"]) == [True, False, False]
 
 class TestDateValidator:
     """Test date validation with type safety"""
@@ -160,6 +264,19 @@ class TestDateValidator:
         timestamp = 1704110400  # Unix timestamp for 2024-01-01 12:00:00 UTC
         result = validator.validate(timestamp)
         assert isinstance(result, datetime)  # Should return datetime object
+    
+    def test_custom_format_validation(self):
+        """Test custom strptime formats and rejection of unparseable values"""
+        validator = Schema.date().formats('iso', '%d/%m/%Y')
+        
+        assert validator.validate("2024-01-01") == datetime(2024, 1, 1)  # ISO still tried first
+        assert validator.validate("31/12/2024") == datetime(2024, 12, 31)  # Custom format
+        
+        with pytest.raises(ValidationError, match="Expected date"):
+            validator.validate("not a date")  # No format matches
+        
+        with pytest.raises(ValidationError, match="Expected date"):
+            validator.validate(1704110400)  # Timestamps not enabled for this validator
 
 class TestArrayValidator:
     """Test array validation with type safety"""
@@ -195,6 +312,32 @@ class TestArrayValidator:
         with pytest.raises(ValidationError, match="must be unique"):
             validator.validate(["a", "b", "a"])  # Duplicate items should fail
     
+    def test_array_unique_complex_items(self):
+        """Test uniqueness for mixed-type and object items"""
+        validator = Schema.array(Schema.object({'a': Schema.number(), 'b': Schema.number()})).unique()
+        
+        with pytest.raises(ValidationError, match="must be unique"):
+            validator.validate([{'a': 1, 'b': 2}, {'b': 2, 'a': 1}])  # Same object, different key order
+        
+        mixed = Schema.array(Schema.string().optional()).unique()
+        assert mixed.validate(["1", None]) == ["1", None]  # Distinct items pass
+        
+        numbers = Schema.array(Schema.number()).unique()
+        assert numbers.validate([1, 2.5, 3]) == [1, 2.5, 3]
+    
+    def test_array_unique_keeps_nested_types_apart(self):
+        """Test that uniqueness tells apart containers Python considers different"""
+        class AnyValidator(Validator):
+            def validate(self, value):
+                return value
+        
+        validator = Schema.array(AnyValidator()).unique()
+        for pair in ([{1: 'a'}, {'1': 'a'}], [{True: 1}, {'true': 1}], [(1, 2), [1, 2]], [[1], [True]]):
+            assert validator.validate(pair) == pair
+        
+        with pytest.raises(ValidationError, match="must be unique"):
+            validator.validate([{'a': [1, {'b': 2}]}, {'a': [1, {'b': 2}]}])
+    
     def test_nested_array_validation(self):
         """Test nested array validation - arrays of arrays"""
         inner_validator = Schema.array(Schema.number())  # Array of numbers
@@ -259,25 +402,178 @@ class TestObjectValidator:
         data = {'name': 'John', 'extra': 'field'}  # Extra field should be allowed
         result = validator.validate(data)
         assert result['name'] == 'John'  # Only schema fields are included in result
+    
+    def test_object_schemas_share_field_layout(self):
+        """Test that schemas with the same fields share their derived key set and template"""
+        first = Schema.object({'name': Schema.string(), 'age': Schema.number()})
+        second = Schema.object({'name': Schema.string().min_length(1), 'age': Schema.number()})
+        
+        assert first._allowed_fields is second._allowed_fields  # One frozenset for both
+        assert first._result_template is second._result_template
+        assert second.validate({'name': 'Bob', 'age': 3}) == {'name': 'Bob', 'age': 3}
+        assert first.validate({'name': '', 'age': 1}) == {'name': '', 'age': 1}  # Field validators stay separate
+    
+    def test_object_schema_is_read_only(self):
+        """Test that the field mapping cannot drift from the derived field layout"""
+        validator = Schema.object({'a': Schema.string()})
+        
+        with pytest.raises(TypeError):
+            validator.schema['b'] = Schema.string()
+        assert list(validator.schema) == ['a']
+    
+    def test_object_recompiles_after_configuration_change(self):
+        """Test that changing object options after validation takes effect"""
+        validator = Schema.object({'name': Schema.string()})
+        data = {'name': 'John', 'extra': 'field'}
+        
+        with pytest.raises(ValidationError, match="Unexpected fields"):
+            validator.validate(data)  # Strict by default
+        
+        validator.allow_extra()
+        assert validator.validate(data) == {'name': 'John'}  # New mode applies
+        
+        validator.with_message("Not an object")
+        with pytest.raises(ValidationError, match="Not an object"):
+            validator.validate("text")
+    
+    def test_object_recompiles_after_field_change(self):
+        """Test that reconfiguring a field validator after validation takes effect"""
+        name = Schema.string()
+        validator = Schema.object({'name': name})
+        assert validator.validate({'name': 'Bob'}) == {'name': 'Bob'}
+        
+        name.min_length(5)
+        with pytest.raises(ValidationError, match="at least 5 characters"):
+            validator.validate({'name': 'Bob'})
+        with pytest.raises(ValidationError, match=r"\[0\]: name: String must be at least 5"):
+            validator.validate_many([{'name': 'Bob'}])
+        
+        compiled = validator._compiled
+        Schema.string().min_length(1)  # Unrelated validators leave the compiled function alone
+        validator.validate({'name': 'Alice'})
+        assert validator._compiled is compiled
+    
+    def test_object_respects_validator_subclasses(self):
+        """Test that field validators overriding their checks are not bypassed"""
+        class UpperStringValidator(StringValidator):
+            __slots__ = ()
+            
+            def _validate(self, value):
+                return super()._validate(value).upper()
+        
+        validator = Schema.object({'code': UpperStringValidator(), 'count': Schema.number()})
+        assert validator.validate({'code': 'abc', 'count': 1}) == {'code': 'ABC', 'count': 1}
+        
+        class StrippedStringValidator(StringValidator):
+            __slots__ = ()
+            
+            def validate(self, value):
+                return super().validate(value.strip())
+        
+        validator = Schema.object({'code': StrippedStringValidator()})
+        assert validator.validate({'code': ' a '}) == {'code': 'a'}
+    
+    def test_object_validate_many(self):
+        """Test batch object validation over a list of records"""
+        validator = Schema.object({
+            'name': Schema.string(),
+            'age': Schema.number().optional()
+        })
+        
+        records = [{'name': 'John', 'age': 30}, {'name': 'Jane'}]
+        assert validator.validate_many(records) == [
+            {'name': 'John', 'age': 30},
+            {'name': 'Jane', 'age': None}  # Optional field filled with None
+        ]
+        
+        with pytest.raises(ValidationError, match=r"\[1\]: Missing required field: name"):
+            validator.validate_many([{'name': 'John'}, {'age': 5}])  # Error reports the record index
+
+class TestMemoizedValidator:
+    """Test opt-in memoization of validation results"""
+    
+    def test_memoized_returns_cached_result(self):
+        """Test that validating the same object twice reuses the first result"""
+        validator = Schema.memoized(Schema.object({'name': Schema.string()}))
+        data = {'name': 'John'}
+        
+        first = validator.validate(data)
+        assert isinstance(validator, MemoizedValidator)
+        assert validator.validate(data) is first  # Same object -> cached result
+        assert validator.validate({'name': 'John'}) is not first  # Different object -> revalidated
+    
+    def test_memoized_sees_configuration_changes(self):
+        """Test that reconfiguring the wrapped validator expires cached results"""
+        inner = Schema.string()
+        validator = Schema.memoized(inner)
+        assert validator.validate("abc") == "abc"
+        
+        inner.min_length(5)
+        with pytest.raises(ValidationError, match="at least 5 characters"):
+            validator.validate("abc")
+        
+        tags = Schema.string()
+        nested = Schema.memoized(Schema.object({'tags': Schema.array(tags)}))
+        data = {'tags': ['abc']}
+        assert nested.validate(data) == data
+        
+        tags.max_length(2)  # Changes deep inside the wrapped schema count too
+        with pytest.raises(ValidationError, match=r"tags: \[0\]: String must be at most 2"):
+            nested.validate(data)
+    
+    def test_memoized_results_are_shared(self):
+        """Test that cached results are shared, so changes to one show up in later results"""
+        validator = Schema.memoized(Schema.object({'tags': Schema.array(Schema.string())}))
+        data = {'tags': ['a']}
+        
+        first = validator.validate(data)
+        first['tags'].append('b')  # Mutating a result alters the cached entry...
+        assert validator.validate(data) == {'tags': ['a', 'b']}
+        
+        Schema.invalidate()  # ...until the cache is dropped
+        assert validator.validate(data) == {'tags': ['a']}
+    
+    def test_memoized_invalidate(self):
+        """Test that Schema.invalidate() expires cached results"""
+        validator = Schema.memoized(Schema.object({'name': Schema.string()}))
+        data = {'name': 'John'}
+        validator.validate(data)
+        
+        data['name'] = 123  # Mutation after validation requires invalidation
+        Schema.invalidate()
+        
+        with pytest.raises(ValidationError, match="Expected string"):
+            validator.validate(data)
+    
+    def test_memoized_optional_field(self):
+        """Test that memoized validators keep optional semantics inside objects"""
+        validator = Schema.object({'age': Schema.memoized(Schema.number()).optional()})
+        
+        assert validator.validate({}) == {'age': None}  # Missing optional field is allowed
+
+@pytest.fixture(scope='module')
+def address_schema():
+    """Address object schema shared by the nested validation tests (built once per module)"""
+    return Schema.object({
+        'street': Schema.string().min_length(1),
+        'city': Schema.string().min_length(1),
+        'country': Schema.string().min_length(2)
+    })
+
+@pytest.fixture(scope='module')
+def user_schema(address_schema):
+    """User object schema with an array of addresses (built once per module)"""
+    return Schema.object({
+        'id': Schema.string().min_length(1),
+        'name': Schema.string().min_length(2),
+        'addresses': Schema.array(address_schema).min_length(1)  # Array of addresses
+    })
 
 class TestComplexNestedValidation:
     """Test complex nested validation scenarios"""
     
-    def test_deeply_nested_objects(self):
+    def test_deeply_nested_objects(self, user_schema):
         """Test validation of deeply nested object structures"""
-        # Define nested schemas
-        address_schema = Schema.object({
-            'street': Schema.string().min_length(1),
-            'city': Schema.string().min_length(1),
-            'country': Schema.string().min_length(2)
-        })
-        
-        user_schema = Schema.object({
-            'id': Schema.string().min_length(1),
-            'name': Schema.string().min_length(2),
-            'addresses': Schema.array(address_schema).min_length(1)  # Array of addresses
-        })
-        
         # Valid nested data
         data = {
             'id': '123',
@@ -292,24 +588,15 @@ class TestComplexNestedValidation:
         assert len(result['addresses']) == 2  # Should have 2 addresses
         assert result['addresses'][0]['street'] == '123 Main St'  # Nested validation should work
     
-    def test_validation_error_paths(self):
+    def test_validation_error_paths(self, user_schema):
         """Test that validation errors include proper field paths for nested structures"""
-        address_schema = Schema.object({
-            'street': Schema.string().min_length(1),
-            'city': Schema.string().min_length(1)
-        })
-        
-        user_schema = Schema.object({
-            'name': Schema.string().min_length(2),
-            'addresses': Schema.array(address_schema)
-        })
-        
         # Data with validation error in nested structure
         data = {
+            'id': '123',
             'name': 'John',
             'addresses': [
-                {'street': '', 'city': 'Anytown'},  # Invalid: empty street
-                {'street': '123 Main St', 'city': 'Anytown'}  # Valid
+                {'street': '', 'city': 'Anytown', 'country': 'USA'},  # Invalid: empty street
+                {'street': '123 Main St', 'city': 'Anytown', 'country': 'USA'}  # Valid
             ]
         }
         
@@ -345,6 +632,29 @@ class TestTypeSafety:
         # These should have different inferred types and work correctly
         assert string_array_validator.validate(["a", "b"]) == ["a", "b"]  # String array
         assert number_array_validator.validate([1, 2]) == [1, 2]  # Number array
+    
+    def test_validators_use_slots(self):
+        """Test that validators store their settings in slots instead of a per-instance __dict__"""
+        validators = [
+            Schema.string(), Schema.number(), Schema.boolean(), Schema.date(),
+            Schema.object({'name': Schema.string()}), Schema.array(Schema.string())
+        ]
+        
+        for validator in validators:
+            assert not hasattr(validator, '__dict__')  # Slots remove the instance dict
+    
+    def test_validate_only_subclass(self):
+        """Test that custom validators implementing only validate() still work"""
+        class EvenValidator(Validator):
+            def validate(self, value):
+                if value % 2:
+                    raise ValidationError("Expected an even number")
+                return value
+        
+        validator = Schema.object({'items': Schema.array(EvenValidator())})
+        assert validator.validate({'items': [2, 4]}) == {'items': [2, 4]}
+        with pytest.raises(ValidationError, match=r"items: \[1\]: Expected an even number"):
+            validator.validate({'items': [2, 3]})
 
 if __name__ == "__main__":
     # Run basic tests when script is executed directly
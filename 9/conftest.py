@@ -0,0 +1,120 @@
+"""
+Shared pytest fixtures for the Service Analysis Console Application tests.
+"""
+
+import asyncio
+import json
+import os
+import time
+from types import SimpleNamespace
+
+import openai
+import pytest
+
+import service_analyzer
+from service_analyzer import ServiceAnalyzer
+from report_generator import ReportGenerator
+
+# Inputs analyzed by more than one test, keyed by the name tests look them up with
+BATCHED_INPUTS = {
+    "spotify": ("Spotify", "service_name"),
+    "description": ("A music streaming service that allows users to listen to millions of songs", "description"),
+    "unknown": ("UnknownService123", "service_name"),
+}
+
+
+# Reply returned by the mocked OpenAI client, wrapped in prose like a real model reply
+CANNED_REPLY = {
+    "name": "Figma",
+    "description": "A collaborative interface design tool.",
+    "founding_year": "2012",
+    "target_audience": ["Designers", "Product teams"],
+    "core_features": ["Vector editing", "Real-time collaboration"],
+    "unique_selling_points": ["Runs in the browser"],
+    "business_model": "Freemium with paid team plans",
+    "tech_stack": ["C++", "WebAssembly"],
+    "strengths": ["Multiplayer editing"],
+    "weaknesses": ["Needs a connection"],
+}
+
+
+@pytest.fixture(autouse=True)
+def _offline(request, monkeypatch):
+    """Keep tests not marked live away from the real OpenAI API and its retry backoff."""
+    if "live" not in request.keywords:
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        monkeypatch.setenv("OPENAI_MAX_RETRIES", "0")
+        monkeypatch.setattr(time, "sleep", lambda *args: None)
+
+
+@pytest.fixture
+def mock_openai(monkeypatch):
+    """Answer every OpenAI chat completion, sync or async, with CANNED_REPLY; yields the request kwargs."""
+    calls = []
+    content = f"Here is the analysis:\n{json.dumps(CANNED_REPLY)}"
+    
+    def create(**kwargs):
+        calls.append(kwargs)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+    
+    async def acreate(self, **kwargs):
+        return create(**kwargs)
+    
+    monkeypatch.setattr(service_analyzer.openai.chat.completions, "create", create)
+    monkeypatch.setattr(openai.resources.chat.AsyncCompletions, "create", acreate)
+    # ServiceAnalyzer configures the module-level client; restore it afterwards
+    monkeypatch.setattr(service_analyzer.openai, "api_key", service_analyzer.openai.api_key)
+    monkeypatch.setattr(service_analyzer.openai, "max_retries", service_analyzer.openai.max_retries)
+    service_analyzer._openai_fetch.cache_clear()
+    yield calls
+    service_analyzer._openai_fetch.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def openai_api_key():
+    """The real OpenAI API key for live tests; skips them when none is set."""
+    api_key = os.environ.get("OPENAI_API_KEY")
+    if not api_key:
+        pytest.skip("No OPENAI_API_KEY found in environment")
+    return api_key
+
+
+@pytest.fixture(scope="module")
+def vcr_config():
+    """pytest-recording settings: keep the API key out of recorded cassettes."""
+    return {"filter_headers": ["authorization"]}
+
+
+@pytest.fixture(scope="session")
+def analyzer():
+    """One rule-based ServiceAnalyzer shared by every test in the run."""
+    analyzer = ServiceAnalyzer()
+    analyzer.openai_api_key = None  # Built before _offline applies; never use a real key
+    yield analyzer
+    # Release memoized OpenAI replies once the suite is done with them
+    service_analyzer._openai_fetch.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def generator():
+    """One ReportGenerator, with its default in-memory cache, shared by every test."""
+    generator = ReportGenerator()
+    yield generator
+    generator._memory_cache.clear()  # Drop the memoized report strings
+
+
+@pytest.fixture(scope="session")
+def batched_results(analyzer):
+    """Every BATCHED_INPUTS analysis, fetched together through analyze_many.
+    
+    Any OpenAI requests go out concurrently, so the batch costs one round trip
+    of wall time. Tests must not mutate the results.
+    """
+    results = asyncio.run(analyzer.analyze_many(list(BATCHED_INPUTS.values())))
+    return dict(zip(BATCHED_INPUTS, results))
+
+
+@pytest.fixture(scope="session")
+def spotify_info(batched_results):
+    """Spotify analyzed once per run; tests must not mutate it."""
+    return batched_results["spotify"]
@@ -6,10 +6,17 @@ This script showcases all the capabilities of the application
 by running various examples and generating sample reports.
 """
 
-import os
 import sys
 from datetime import datetime
 
+from report_generator import ReportGenerator
+
+
+def save_report(report: str, output_path: str) -> None:
+    """Write a generated report to a markdown file."""
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(report)
+
 
 def run_demo():
     """Run a comprehensive demonstration of the application."""
@@ -17,10 +24,14 @@ def run_demo():
     print("=" * 60)
     print()
     
+    # All demos run in this process and share one generator, instead of
+    # paying interpreter startup and imports for a main.py subprocess each
+    report_generator = ReportGenerator()
+    
     # Demo 1: Known service analysis
     print("📊 Demo 1: Analyzing Known Service (Spotify)")
     print("-" * 40)
-    os.system('python main.py --service "Spotify" --output demo_spotify.md')
+    save_report(report_generator.generate_report("Spotify", "service_name"), "demo_spotify.md")
     print("✅ Spotify analysis completed and saved to demo_spotify.md")
     print()
     
@@ -28,23 +39,26 @@ def run_demo():
     print("📝 Demo 2: Analyzing Service Description")
     print("-" * 40)
     description = "A video conferencing platform that enables remote meetings and webinars"
-    os.system(f'python main.py --text "{description}" --output demo_videoconf.md')
+    save_report(report_generator.generate_report(description, "description"), "demo_videoconf.md")
     print("✅ Video conferencing analysis completed and saved to demo_videoconf.md")
     print()
     
     # Demo 3: Another known service
     print("📋 Demo 3: Analyzing Another Known Service (GitHub)")
     print("-" * 40)
-    os.system('python main.py --service "GitHub" --output demo_github.md')
+    save_report(report_generator.generate_report("GitHub", "service_name"), "demo_github.md")
     print("✅ GitHub analysis completed and saved to demo_github.md")
     print()
     
     # Demo 4: Console output
     print("🖥️  Demo 4: Console Output (Slack)")
     print("-" * 40)
-    print("Running: python main.py --service 'Slack'")
+    print("Equivalent to: python main.py --service 'Slack'")
     print()
-    os.system('python main.py --service "Slack"')
+    print("\n" + "="*80)
+    print("SERVICE ANALYSIS REPORT")
+    print("="*80)
+    print(report_generator.generate_report("Slack", "service_name"))
     print()
     
     # Summary
@@ -7,16 +7,24 @@ for services or products from multiple viewpoints including business, technical,
 and user-focused perspectives.
 """
 
-import argparse
 import sys
 import os
+from types import SimpleNamespace
 from typing import Optional
-from service_analyzer import ServiceAnalyzer
-from report_generator import ReportGenerator
 
+# Flags understood by the lightweight parser; anything else falls back to argparse
+_VALUE_FLAGS = {
+    "--service": "service", "-s": "service",
+    "--text": "text", "-t": "text",
+    "--output": "output", "-o": "output",
+}
+_SWITCH_FLAGS = {"--verbose": "verbose", "-v": "verbose", "--cache": "cache"}
 
-def main():
-    """Main entry point for the console application."""
+
+def build_parser():
+    """Build the full argparse parser, used for --help and unrecognised input."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Generate comprehensive service analysis reports",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -53,22 +61,59 @@ Examples:
         help="Enable verbose output"
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse reports cached in ~/.cache/service_analyzer for up to a day"
+    )
+    
+    return parser
+
+
+def parse_args(argv=None):
+    """
+    Parse command line arguments without importing argparse on the common path.
+    
+    Only plain ``--flag value`` / ``-f value`` forms are handled here; help
+    requests and anything unexpected are handed to the full argparse parser
+    so usage and error messages stay exactly the same.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    args = SimpleNamespace(service=None, text=None, output=None, verbose=False, cache=False)
+    
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in _SWITCH_FLAGS:
+            setattr(args, _SWITCH_FLAGS[arg], True)
+            i += 1
+        elif arg in _VALUE_FLAGS and i + 1 < len(argv) and not argv[i + 1].startswith("-"):
+            setattr(args, _VALUE_FLAGS[arg], argv[i + 1])
+            i += 2
+        else:
+            return build_parser().parse_args(argv)
+    
+    return args
+
+
+def main():
+    """Main entry point for the console application."""
+    args = parse_args()
     
     # Validate input
     if not args.service and not args.text:
         print("Error: You must provide either --service or --text")
-        parser.print_help()
+        build_parser().print_help()
         sys.exit(1)
     
     if args.service and args.text:
         print("Error: Please provide either --service OR --text, not both")
         sys.exit(1)
     
+    # Deferred so that --help and argument errors don't pay for these imports
+    from report_generator import ReportGenerator, DEFAULT_CACHE_DIR
+    
     try:
-        # Initialize the service analyzer
-        analyzer = ServiceAnalyzer()
-        
         # Get input data
         if args.service:
             input_data = args.service
@@ -78,22 +123,28 @@ Examples:
             input_type = "description"
         
         if args.verbose:
+            # Surface the analyzer's debug messages (model choice, OpenAI attempts)
+            import logging
+            logging.basicConfig(format="%(message)s")
+            logging.getLogger("service_analyzer").setLevel(logging.DEBUG)
             print(f"Analyzing {input_type}: {input_data}")
         
-        # Generate the report
-        report_generator = ReportGenerator()
-        report = report_generator.generate_report(input_data, input_type)
+        # Generate the report, streaming it straight to its destination
+        report_generator = ReportGenerator(
+            cache_dir=DEFAULT_CACHE_DIR if args.cache else None, use_cache=args.cache
+        )
         
         # Output the report
         if args.output:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                f.write(report)
+            with open(args.output, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                report_generator.generate_report_stream(input_data, input_type, f)
             print(f"Report saved to: {args.output}")
         else:
             print("\n" + "="*80)
             print("SERVICE ANALYSIS REPORT")
             print("="*80)
-            print(report)
+            report_generator.generate_report_stream(input_data, input_type, sys.stdout)
+            print()
             
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.")
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Build script for the Service Analysis Console Application.
+
+A plain install ships the pure-Python modules. Set SERVICE_ANALYZER_MYPYC=1 to
+compile the report generator to a C extension with mypyc (requires mypy at
+build time):
+
+    SERVICE_ANALYZER_MYPYC=1 pip install .
+"""
+
+import os
+from setuptools import setup
+
+# Modules compiled by mypyc; service_analyzer stays pure Python (its time goes to
+# the OpenAI round trip, and the openai stubs are not needed to build)
+MYPYC_MODULES = [
+    "report_generator.py",
+]
+
+ext_modules = []
+if os.environ.get("SERVICE_ANALYZER_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify(["--ignore-missing-imports", "--follow-imports=silent", *MYPYC_MODULES])
+
+setup(
+    name="service-analyzer",
+    version="1.0.0",
+    description="Console application that generates markdown service analysis reports",
+    py_modules=["main", "report_generator", "service_analyzer"],
+    python_requires=">=3.10",
+    install_requires=["typing-extensions>=4.0.0", "openai>=1.0.0"],
+    ext_modules=ext_modules,
+)
@@ -1,101 +1,241 @@
-#!/usr/bin/env python3
 """
-Simple test script for the Service Analysis Console Application
+Tests for the Service Analysis Console Application
+
+Shared analyzer and generator fixtures live in conftest.py.
 """
 
+import asyncio
+import io
+import logging
 import sys
 import os
+import tempfile
 
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+import service_analyzer
 from service_analyzer import ServiceAnalyzer
 from report_generator import ReportGenerator
 
+# Progress notes go through logging so pytest captures them without a write per line;
+# show them with --log-cli-level=INFO
+logger = logging.getLogger(__name__)
+
+# Headings every Spotify report must contain, matched against whole heading lines
+REQUIRED_SECTIONS = frozenset([
+    "# Spotify - Comprehensive Service Analysis",
+    "## 📋 Executive Summary",
+    "## 📅 Brief History",
+    "## 🎯 Target Audience",
+    "## ⚡ Core Features",
+    "## 🌟 Unique Selling Points",
+    "## 💼 Business Model",
+    "## 🔧 Tech Stack Insights",
+    "## ✅ Perceived Strengths",
+    "## ⚠️ Perceived Weaknesses",
+])
 
-def test_known_service():
+
+def test_known_service(spotify_info):
     """Test analysis of a known service."""
-    print("Testing known service analysis...")
+    logger.info("Testing known service analysis...")
     
-    analyzer = ServiceAnalyzer()
-    service_info = analyzer.analyze_service_name("Spotify")
+    service_info = spotify_info
     
     assert service_info.name == "Spotify"
     assert service_info.founding_year == "2006"
     assert len(service_info.core_features) > 0
     
-    print("✅ Known service analysis test passed")
+    logger.info("✅ Known service analysis test passed")
 
 
-def test_description_analysis():
+def test_description_analysis(batched_results):
     """Test analysis of service description."""
-    print("Testing description analysis...")
+    logger.info("Testing description analysis...")
     
-    analyzer = ServiceAnalyzer()
-    description = "A music streaming service that allows users to listen to millions of songs"
-    service_info = analyzer.analyze_description(description)
+    service_info = batched_results["description"]
     
     assert service_info.name is not None
     assert len(service_info.description) > 0
     
-    print("✅ Description analysis test passed")
+    logger.info("✅ Description analysis test passed")
 
 
-def test_report_generation():
-    """Test report generation."""
-    print("Testing report generation...")
+def test_service_name_extraction(analyzer):
+    """Test that the first capitalized word is taken as the service name."""
+    logger.info("Testing service name extraction...")
     
-    generator = ReportGenerator()
-    report = generator.generate_report("Spotify", "service_name")
+    assert analyzer._extract_service_name("A tool by an iPhone maker: Slack, for teams") == "Slack,"
+    assert analyzer._extract_service_name("a tool for teams") == "Unknown Service"
+    assert analyzer._extract_service_name("an app named Émile") == "Émile"
     
-    assert "# Spotify - Comprehensive Service Analysis" in report
-    assert "## 📋 Executive Summary" in report
-    assert "## 📅 Brief History" in report
-    assert "## 🎯 Target Audience" in report
-    assert "## ⚡ Core Features" in report
-    assert "## 🌟 Unique Selling Points" in report
-    assert "## 💼 Business Model" in report
-    assert "## 🔧 Tech Stack Insights" in report
-    assert "## ✅ Perceived Strengths" in report
-    assert "## ⚠️ Perceived Weaknesses" in report
+    logger.info("✅ Service name extraction test passed")
+
+
+def test_batch_analysis(analyzer, monkeypatch):
+    """Test that analyze_many returns one result per item, in order."""
+    logger.info("Testing batch analysis...")
+    
+    monkeypatch.setattr(analyzer, "openai_api_key", None)  # Rule-based path, no network
+    results = asyncio.run(analyzer.analyze_many([
+        ("Spotify", "service_name"),
+        ("Trello lets teams organize their projects", "description"),
+    ]))
+    
+    assert [info.name for info in results] == ["Spotify", "Trello"]
+    assert results[0].founding_year == "2006"
     
-    print("✅ Report generation test passed")
+    logger.info("✅ Batch analysis test passed")
 
 
-def test_unknown_service():
-    """Test analysis of unknown service."""
-    print("Testing unknown service analysis...")
+def test_openai_analysis(mock_openai, monkeypatch):
+    """Test that an OpenAI reply is parsed into ServiceInfo."""
+    logger.info("Testing OpenAI analysis...")
     
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
     analyzer = ServiceAnalyzer()
-    service_info = analyzer.analyze_service_name("UnknownService123")
+    assert analyzer.max_retries == 0  # Set by the conftest _offline fixture
+    service_info = analyzer.analyze_service_name("Figma")
     
-    assert service_info.name == "UnknownService123"
-    assert service_info.founding_year == "Unknown"
+    assert service_info.name == "Figma"
+    assert service_info.founding_year == "2012"
+    assert service_info.tech_stack == ["C++", "WebAssembly"]
+    assert analyzer.analyze_service_name("Figma") == service_info
+    assert len(mock_openai) == 1  # The repeat is served from the response cache
+    assert mock_openai[0]["response_format"]["type"] == "json_schema"
     
-    print("✅ Unknown service analysis test passed")
+    logger.info("✅ OpenAI analysis test passed")
 
 
-def main():
-    """Run all tests."""
-    print("🧪 Running Service Analysis Application Tests")
-    print("=" * 50)
+def test_openai_batch_analysis(mock_openai, monkeypatch):
+    """Test that analyze_many reaches OpenAI on every event loop it runs in."""
+    logger.info("Testing OpenAI batch analysis...")
     
-    try:
-        test_known_service()
-        test_description_analysis()
-        test_report_generation()
-        test_unknown_service()
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    analyzer = ServiceAnalyzer()
+    for _ in range(2):  # Each asyncio.run() has its own event loop
+        [service_info] = asyncio.run(analyzer.analyze_many([("Figma", "service_name")]))
+        assert service_info.founding_year == "2012"
+    
+    assert len(mock_openai) == 2
+    
+    logger.info("✅ OpenAI batch analysis test passed")
+
+
+def test_report_generation(generator, spotify_info):
+    """Test report generation."""
+    logger.info("Testing report generation...")
+    
+    report = generator.generate_report("Spotify", "service_name", spotify_info)
+    
+    headings = {line for line in report.splitlines() if line.startswith("#")}
+    missing = REQUIRED_SECTIONS - headings
+    assert not missing, missing
+    
+    logger.info("✅ Report generation test passed")
+
+
+def test_report_caching():
+    """Test that reports are reused from the memory and disk caches."""
+    logger.info("Testing report caching...")
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        generator = ReportGenerator(cache_dir=cache_dir)
+        report = generator.generate_report("Spotify", "service_name")
         
-        print("\n" + "=" * 50)
-        print("🎉 All tests passed successfully!")
-        print("\nYou can now run the application with:")
-        print("  python main.py --service \"Spotify\"")
-        print("  python main.py --text \"A productivity app for teams\"")
+        assert generator.generate_report("Spotify", "service_name") is report
+        assert len(os.listdir(cache_dir)) == 1
         
-    except Exception as e:
-        print(f"\n❌ Test failed: {e}")
-        sys.exit(1)
+        # A fresh generator reads the report back from disk
+        assert ReportGenerator(cache_dir=cache_dir).generate_report("Spotify", "service_name") == report
+    
+    logger.info("✅ Report caching test passed")
+
 
+def test_report_cache_modes(mock_openai, monkeypatch):
+    """Test that the disk cache separates analysis modes, expires, and skips fallbacks."""
+    logger.info("Testing report cache modes...")
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        rules_report = ReportGenerator(cache_dir=cache_dir).generate_report("Figma", "service_name")
+        assert "Historical information not available" in rules_report
+        
+        # Setting a key switches to a separate cache entry instead of the rule-based report
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        ai_report = ReportGenerator(cache_dir=cache_dir).generate_report("Figma", "service_name")
+        assert "**Founded:** 2012" in ai_report
+        assert len(os.listdir(cache_dir)) == 2
+        
+        # Expired entries are regenerated
+        service_analyzer._openai_fetch.cache_clear()
+        ReportGenerator(cache_dir=cache_dir, cache_ttl=0).generate_report("Figma", "service_name")
+        assert len(mock_openai) == 2
+        
+        # A fallback after an OpenAI failure is returned but not persisted
+        def fail(**kwargs):
+            raise RuntimeError("rate limited")
+        monkeypatch.setattr(service_analyzer.openai.chat.completions, "create", fail)
+        fallback = ReportGenerator(cache_dir=cache_dir).generate_report("Notion AI", "service_name")
+        assert "Historical information not available" in fallback
+        assert len(os.listdir(cache_dir)) == 2
+    
+    logger.info("✅ Report cache modes test passed")
+
+
+def test_report_memory_cache_skips_fallback(mock_openai, monkeypatch):
+    """Test that a generator retries OpenAI after a fallback instead of memoizing it."""
+    logger.info("Testing report memory cache fallback handling...")
+    
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    generator = ReportGenerator()
+    create = service_analyzer.openai.chat.completions.create
+    
+    def fail(**kwargs):
+        raise RuntimeError("rate limited")
+    monkeypatch.setattr(service_analyzer.openai.chat.completions, "create", fail)
+    assert "Historical information not available" in generator.generate_report("Figma", "service_name")
+    
+    # Once the API recovers, the same generator returns the OpenAI report and keeps it
+    monkeypatch.setattr(service_analyzer.openai.chat.completions, "create", create)
+    report = generator.generate_report("Figma", "service_name")
+    assert "**Founded:** 2012" in report
+    assert generator.generate_report("Figma", "service_name") is report
+    
+    generator.cache_ttl = 0  # Expired reports are regenerated
+    assert generator.generate_report("Figma", "service_name") is not report
+    
+    logger.info("✅ Report memory cache fallback test passed")
+
+
+def test_report_streaming(spotify_info):
+    """Test that streaming a report writes the same markdown as generating it."""
+    logger.info("Testing report streaming...")
+    
+    generator = ReportGenerator(use_cache=False)
+    out = io.StringIO()
+    generator.generate_report_stream("Spotify", "service_name", out)
+    report = out.getvalue()
+    
+    assert report.startswith("# Spotify - Comprehensive Service Analysis")
+    assert "## 💡 Strategic Recommendations" in report
+    assert report.endswith("*")  # Footer line, no trailing newline
+    
+    out = io.StringIO()
+    generator.stream_report(spotify_info, out)
+    assert out.getvalue().startswith("# Spotify - Comprehensive Service Analysis")
+    
+    logger.info("✅ Report streaming test passed")
+
+
+def test_unknown_service(batched_results):
+    """Test analysis of unknown service."""
+    logger.info("Testing unknown service analysis...")
+    
+    service_info = batched_results["unknown"]
+    
+    assert service_info.name == "UnknownService123"
+    assert service_info.founding_year == "Unknown"
+    
+    logger.info("✅ Unknown service analysis test passed")
 
-if __name__ == "__main__":
-    main() 
\ No newline at end of file
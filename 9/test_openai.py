@@ -3,48 +3,63 @@
 Test script to check OpenAI API access and available models
 """
 
-import os
+import asyncio
+import logging
+from itertools import islice
+
 import openai
+import pytest
+
+logger = logging.getLogger(__name__)
+
+
+async def _probe(api_key):
+    """List models and request a short completion concurrently; failures are returned."""
+    # The async client's connections belong to asyncio.run's event loop, so it
+    # is opened and closed within that loop
+    async with openai.AsyncOpenAI(api_key=api_key) as client:
+        return await asyncio.gather(
+            client.models.list(),
+            client.chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=[{"role": "user", "content": "Say hello"}],
+                max_tokens=10
+            ),
+            return_exceptions=True
+        )
+
 
-def test_openai_access():
+@pytest.mark.live
+@pytest.mark.vcr
+def test_openai_access(openai_api_key):
     """Test OpenAI API access and list available models."""
-    api_key = os.environ.get("OPENAI_API_KEY")
-    if not api_key:
-        print("No OPENAI_API_KEY found in environment")
-        return
+    logger.info("API Key found: %s...", openai_api_key[:10])
     
-    print(f"API Key found: {api_key[:10]}...")
+    # Both requests are independent, so they share one round trip of wall time
+    logger.info("Listing models and testing a simple completion...")
+    models, response = asyncio.run(_probe(openai_api_key))
     
-    # Set the API key
-    openai.api_key = api_key
+    assert not isinstance(models, Exception), (
+        f"Error accessing OpenAI API: {type(models).__name__}: {models}\n\nPossible issues:\n"
+        "1. The request is not in a cassette and recording is off (pass --record-mode=once)\n"
+        "2. Your API key might be for a different service\n"
+        "3. You might need to upgrade your OpenAI plan\n"
+        "4. Your organization might have restrictions\n"
+        "5. You might be using a custom endpoint"
+    )
+    assert models.data
+    # One record for the whole listing; the first 10 are taken without copying a slice
+    logger.info(
+        "Success! Found %d models:\n%s",
+        len(models.data),
+        "\n".join(f"  - {model.id}" for model in islice(models.data, 10))
+    )
     
-    try:
-        # Try to list models
-        print("Attempting to list available models...")
-        models = openai.models.list()
-        print(f"Success! Found {len(models.data)} models:")
-        for model in models.data[:10]:  # Show first 10
-            print(f"  - {model.id}")
-        
-        # Try a simple completion with a basic model
-        print("\nTesting simple completion...")
-        try:
-            response = openai.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": "Say hello"}],
-                max_tokens=10
-            )
-            print(f"Success! Response: {response.choices[0].message.content}")
-        except Exception as e:
-            print(f"Chat completion failed: {e}")
-            
-    except Exception as e:
-        print(f"Error accessing OpenAI API: {e}")
-        print("\nPossible issues:")
-        print("1. Your API key might be for a different service")
-        print("2. You might need to upgrade your OpenAI plan")
-        print("3. Your organization might have restrictions")
-        print("4. You might be using a custom endpoint")
+    assert not isinstance(response, Exception), f"Chat completion failed: {type(response).__name__}: {response}"
+    logger.info("Success! Response: %s", response.choices[0].message.content)
+
 
 if __name__ == "__main__":
-    test_openai_access() 
\ No newline at end of file
+    # Record a cassette on the first run and replay it afterwards; pytest-recording's
+    # default mode would block every request not already in a cassette
+    raise SystemExit(pytest.main(["-m", "live", "--record-mode=once", "--log-cli-level=INFO", __file__])) 
\ No newline at end of file